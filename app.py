@@ -1,12 +1,25 @@
 import streamlit as st
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import pandas as pd
+import atexit
 import json
-import html
+import logging
+import time
+import threading
+import functools
+import itertools
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import quote
-from datetime import datetime
-from dataclasses import dataclass, asdict
-from typing import Optional, List, Dict, Any, Tuple
+from types import MappingProxyType
+from dataclasses import dataclass, fields, replace
+from typing import Optional, List, Dict, Any, Tuple, Union, Callable, Sequence, TypeVar
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json handles bytes too
+    orjson = None
 
 # Import our new modules
 from config import api_config, cache_config, ui_config, validation_config
@@ -21,8 +34,8 @@ from exceptions import (
 )
 from logger import logger
 from rate_limiter import rate_limiter
-from validators import QueryValidator, CoordinateValidator, ResponseValidator
-from styles import DESIGN_SYSTEM_CSS
+from validators import ResponseValidator, parse_coords, validate_and_sanitize_query, validate_coords
+from styles import DESIGN_SYSTEM_CSS, FONT_LINK_HTML, RESOURCE_HINTS_HTML
 
 # Configure Streamlit page
 st.set_page_config(
@@ -32,56 +45,200 @@ st.set_page_config(
     initial_sidebar_state="collapsed"
 )
 
-@dataclass
+# Shared HTTP session so repeated Nominatim calls reuse pooled keep-alive connections
+_SESSION = requests.Session()
+_SESSION.headers['User-Agent'] = api_config.USER_AGENT
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=api_config.POOL_CONNECTIONS,
+    pool_maxsize=api_config.POOL_MAXSIZE,
+    # Only connection failures are retried: the request never reached Nominatim, so
+    # no rate-limit token is owed. One short retry keeps an unreachable host to about
+    # two connect timeouts; read timeouts and error statuses surface at once.
+    max_retries=Retry(
+        total=api_config.CONNECT_RETRIES,
+        connect=api_config.CONNECT_RETRIES,
+        read=0,
+        status=0,
+        other=0,
+        backoff_factor=api_config.CONNECT_RETRY_BACKOFF_FACTOR,
+        allowed_methods=frozenset({'GET'}),
+        raise_on_status=False
+    )
+))
+atexit.register(_SESSION.close)
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so one except clause covers both
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Per-request overrides for English results; the User-Agent lives on the session
+_ENGLISH_HEADERS = MappingProxyType({'Accept-Language': 'en-US,en;q=0.9'})
+_ENGLISH_PARAMS = (('accept-language', 'en'),)
+
+_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+# Turns a _TIMESTAMP_FORMAT stamp into the compact export filename form
+_FILE_STAMP_TABLE = str.maketrans({'-': None, ':': None, ' ': '_'})
+
+
+def _now_str() -> str:
+    """Format the current local time for result timestamps."""
+    return time.strftime(_TIMESTAMP_FORMAT)
+
+
+# OSM feature classes that consistently lack postcodes; reverse lookups would not find one
+_NO_POSTCODE_CLASSES = frozenset({'natural', 'waterway', 'leisure', 'boundary'})
+
+_T = TypeVar('_T')
+_R = TypeVar('_R')
+
+# Fetch cache counters: calls through _fetch_from_api vs. actual network misses
+_CACHE_STATS = {"calls": 0, "misses": 0, "total_ms": 0.0}
+_CACHE_STATS_LOCK = threading.Lock()
+
+# Shared read-only fallback for results without an address block
+_EMPTY = MappingProxyType({})
+
+# Plain "lat, lng" input; every character is already sanitize-safe
+_PLAIN_COORD_CHARS = frozenset("0123456789.,+- ")
+
+@functools.lru_cache(maxsize=cache_config.QUERY_CACHE_MAX_ENTRIES)
+def _parse_query(raw_query: str) -> Tuple[str, Optional[Tuple[float, float]]]:
+    """Validate, sanitize and coordinate-parse a query once per distinct input."""
+    stripped = raw_query.strip() if raw_query else raw_query
+    if stripped and ',' in stripped and _PLAIN_COORD_CHARS.issuperset(stripped):
+        # Sanitizing cannot change such input, so try the coordinate parser directly
+        coords = parse_coords(stripped, strict=True)
+        if coords:
+            return " ".join(stripped.split()), coords
+
+    query = validate_and_sanitize_query(raw_query)
+    return query, parse_coords(query, strict=True)
+
+@dataclass(slots=True, frozen=True)
 class LocationData:
     """Location search result."""
     original_query: str
     address: str
     zip_code: str
-    lat: str
-    lng: str
+    lat: float
+    lng: float
     status: str = "OK"
     error_msg: str = ""
     timestamp: str = ""
 
+_COORD_PARAMS = frozenset({'lat', 'lon'})
+
+
+def _make_cache_key(
+    params: Dict[str, Any],
+    force_english: bool
+) -> Tuple[Tuple[str, str], ...]:
+    """
+    Normalize request params into the cache key, which is also the sent query string.
+
+    Coordinates are rounded to ~1 m and strings trimmed and lowercased so
+    near-duplicate requests share one cache entry.
+    """
+    precision = cache_config.COORD_CACHE_PRECISION
+    items = []
+    for key, value in params.items():
+        if key in _COORD_PARAMS:
+            value = round(float(value), precision)
+        elif isinstance(value, str):
+            value = value.strip().lower()
+        items.append((key, str(value)))
+    params_key = tuple(sorted(items))
+    if force_english:
+        # Bake the language override into the key so it is the final query string
+        params_key += _ENGLISH_PARAMS
+    return params_key
+
 class AddressService:
     """Geocoding service using OpenStreetMap Nominatim API."""
     
+    @staticmethod
+    def _fetch_from_api(
+        url: str,
+        params: Dict[str, Any],
+        force_english: bool,
+        blocking: bool = True
+    ) -> Optional[Any]:
+        """
+        Fetch data from OSM API through the in-process and Streamlit caches.
+
+        Params are flattened by _make_cache_key into a sorted tuple of
+        string pairs so the cache key hashes as plain primitives.
+        With ``blocking=False`` a cache miss fails fast with
+        RateLimitExceededError instead of waiting for a token.
+        """
+        params_key = _make_cache_key(params, force_english)
+        ttl_bucket = int(time.monotonic() // cache_config.TTL_SECONDS)
+        start = time.monotonic()
+        try:
+            return AddressService._hot_fetch(url, params_key, force_english, ttl_bucket, blocking)
+        finally:
+            elapsed_ms = (time.monotonic() - start) * 1000
+            with _CACHE_STATS_LOCK:
+                _CACHE_STATS["calls"] += 1
+                _CACHE_STATS["total_ms"] += elapsed_ms
+
+    @staticmethod
+    @functools.lru_cache(maxsize=cache_config.HOT_CACHE_MAX_ENTRIES)
+    def _hot_fetch(
+        url: str,
+        params_key: Tuple[Tuple[str, str], ...],
+        force_english: bool,
+        ttl_bucket: int,
+        blocking: bool
+    ) -> Optional[Any]:
+        """
+        Return parsed responses by reference, skipping Streamlit's unpickle on hot queries.
+
+        The TTL bucket is part of the key so entries expire with the Streamlit tier.
+        Callers must treat the returned data as read-only.
+        """
+        return AddressService._cached_fetch(url, params_key, force_english, blocking)
+
     @staticmethod
     @st.cache_data(
         ttl=cache_config.TTL_SECONDS,
         show_spinner=False,
         max_entries=cache_config.MAX_CACHE_ENTRIES
     )
-    def _fetch_from_api(
-        url: str, 
-        params: Dict[str, Any], 
-        force_english: bool
+    def _cached_fetch(
+        url: str,
+        params_key: Tuple[Tuple[str, str], ...],
+        force_english: bool,
+        _blocking: bool = True
     ) -> Optional[Any]:
         """
         Fetch data from OSM API with rate limiting and error handling.
         
         Rate limiting is applied inside the function body so that
-        cached results bypass the rate limiter entirely.
+        cached results bypass the rate limiter entirely. The leading
+        underscore keeps ``_blocking`` out of Streamlit's cache key.
         """
-        # Rate limit inside the function so cache hits skip this
-        rate_limiter.acquire(blocking=True)
-
-        headers = {'User-Agent': api_config.USER_AGENT}
-        request_params = dict(params)
+        # Only reached when both cache tiers miss
+        with _CACHE_STATS_LOCK:
+            _CACHE_STATS["misses"] += 1
 
-        if force_english:
-            headers['Accept-Language'] = 'en-US,en;q=0.9'
-            request_params['accept-language'] = 'en'
+        # requests accepts pair sequences, so the cache key is passed as the query string
+        headers = _ENGLISH_HEADERS if force_english else None
         
         try:
             logger.debug("API request to: %s", url)
             
-            response = requests.get(
+            # Rate limit right before the request so cache hits never touch it
+            if _blocking:
+                rate_limiter.acquire(blocking=True)
+            elif not rate_limiter.try_acquire():
+                logger.warning("Rate limit token unavailable, rejecting interactive request")
+                raise RateLimitExceededError()
+            response = _SESSION.get(
                 url,
-                params=request_params,
+                params=params_key,
                 headers=headers,
-                timeout=api_config.TIMEOUT_SECONDS
+                # Short connect timeout so an unreachable host fails fast; reads keep the full budget
+                timeout=(api_config.CONNECT_TIMEOUT_SECONDS, api_config.TIMEOUT_SECONDS)
             )
             
             # Check for rate limiting
@@ -92,8 +249,8 @@ class AddressService:
             # Raise for other HTTP errors
             response.raise_for_status()
             
-            # Parse JSON
-            data = response.json()
+            # Parse JSON straight from the raw bytes
+            data = _json_loads(response.content)
             logger.info("API response successful: %s", type(data))
             return data
             
@@ -115,58 +272,116 @@ class AddressService:
             logger.error("Request failed: %s", type(e).__name__)
             raise APIConnectionError("Request failed")
             
-        except json.JSONDecodeError:
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            # Raw bytes are parsed directly, so bad UTF-8 surfaces here too
             logger.error("Invalid JSON response received")
             raise InvalidResponseError("Invalid JSON response from API")
     
+    @staticmethod
+    def _fan_out(func: Callable[[_T], _R], items: Sequence[_T]) -> List[_R]:
+        """Map func over items on a small thread pool, preserving order."""
+        if len(items) == 1:
+            return [func(items[0])]
+        with ThreadPoolExecutor(
+            max_workers=min(api_config.MAX_FALLBACK_WORKERS, len(items))
+        ) as executor:
+            return list(executor.map(func, items))
+
+    @staticmethod
+    def _reverse_lookup(lat: float, lng: float) -> Optional[Tuple[str, str]]:
+        """
+        Reverse geocode to ``(display_name, postcode)`` via the rounded-coordinate cache.
+
+        Coordinates are rounded so near-duplicate points share one cache entry.
+        """
+        precision = cache_config.COORD_CACHE_PRECISION
+        ttl_bucket = int(time.monotonic() // cache_config.TTL_SECONDS)
+        hits_before = AddressService._reverse_cached.cache_info().hits
+        result = AddressService._reverse_cached(
+            round(float(lat), precision),
+            round(float(lng), precision),
+            ttl_bucket
+        )
+        if AddressService._reverse_cached.cache_info().hits > hits_before:
+            logger.debug("Reverse lookup cache hit")
+        return result
+
+    @staticmethod
+    @functools.lru_cache(maxsize=cache_config.REVERSE_CACHE_MAX_ENTRIES)
+    def _reverse_cached(
+        lat_key: float,
+        lng_key: float,
+        ttl_bucket: int
+    ) -> Optional[Tuple[str, str]]:
+        """Fetch and reduce a reverse geocode response to a hashable tuple."""
+        data = AddressService._fetch_from_api(
+            api_config.OSM_REVERSE_URL,
+            {
+                'lat': lat_key,
+                'lon': lng_key,
+                'format': 'json',
+                'addressdetails': 1
+            },
+            force_english=True
+        )
+        if not data:
+            return None
+        ResponseValidator.validate_osm_reverse_response(data)
+        return (
+            data.get('display_name', 'Unknown'),
+            data.get('address', _EMPTY).get('postcode', '—')
+        )
+
+    def _postcode_for(self, lat: float, lng: float) -> str:
+        """Look up the postcode for a search hit that arrived without one."""
+        try:
+            reverse = self._reverse_lookup(lat, lng)
+            if reverse:
+                return reverse[1] or '—'
+        except Exception:
+            logger.debug("Reverse geocode for postcode failed, skipping")
+        return '—'
+
     def _reverse_geocode(
         self,
         lat: float,
         lng: float,
-        query: str
-    ) -> List[LocationData]:
+        query: str,
+        timestamp: Optional[str] = None
+    ) -> LocationData:
         """
         Perform reverse geocoding (coordinates -> address).
+
+        Callers that already stamped the search pass ``timestamp`` to reuse it.
         """
         try:
             # Validate coordinates
-            lat_valid, lng_valid = CoordinateValidator.validate(lat, lng)
+            lat_valid, lng_valid = validate_coords(lat, lng)
             
             logger.debug("Reverse geocoding: %s, %s", lat_valid, lng_valid)
             
-            # Fetch from API
-            data = self._fetch_from_api(
-                api_config.OSM_REVERSE_URL,
-                {
-                    'lat': lat_valid,
-                    'lon': lng_valid,
-                    'format': 'json'
-                },
-                force_english=True
-            )
+            # Fetch from API (validated and reduced to address/postcode)
+            reverse = self._reverse_lookup(lat_valid, lng_valid)
             
-            if not data:
+            if not reverse:
                 raise LocationNotFoundError(query)
             
-            # Validate response
-            ResponseValidator.validate_osm_reverse_response(data)
-            
             # Extract data
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            address = data.get('display_name', 'Unknown')
-            zip_code = data.get('address', {}).get('postcode', '—')
+            if timestamp is None:
+                timestamp = _now_str()
+            address, zip_code = reverse
             
             logger.debug("Reverse geocoding successful")
             
-            return [LocationData(
+            return LocationData(
                 original_query=query,
                 address=address,
                 zip_code=zip_code,
-                lat=str(lat_valid),
-                lng=str(lng_valid),
+                lat=lat_valid,
+                lng=lng_valid,
                 status="OK",
                 timestamp=timestamp
-            )]
+            )
             
         except GeoServiceException:
             raise
@@ -179,18 +394,25 @@ class AddressService:
         Search for location by query (address or coordinates).
         """
         try:
-            # Validate and sanitize input
-            query = QueryValidator.validate(raw_query)
-            query = QueryValidator.sanitize(query)
+            # Reject oversized input before it can reach any cache key
+            if raw_query and len(raw_query) > validation_config.MAX_QUERY_LENGTH:
+                raise ValidationError(
+                    f"Query too long (max {validation_config.MAX_QUERY_LENGTH} characters)",
+                    field="query"
+                )
+
+            # Validate, sanitize and try to parse as coordinates first; whitespace
+            # variants collapse to one cache entry
+            query, coords = _parse_query(" ".join(raw_query.split()) if raw_query else raw_query)
             
             logger.debug("Search initiated")
+            # One stamp for every result this search produces
+            timestamp = _now_str()
             
-            # Try to parse as coordinates first
-            coords = CoordinateValidator.parse_from_query(query, strict=True)
             if coords:
                 lat, lng = coords
                 logger.debug("Query identified as coordinates")
-                return self._reverse_geocode(lat, lng, query)
+                return [self._reverse_geocode(lat, lng, query, timestamp)]
             
             # Search by address — force English so Hebrew queries return English addresses
             logger.debug("Searching by address")
@@ -203,7 +425,8 @@ class AddressService:
                     'countrycodes': api_config.DEFAULT_COUNTRY_CODE,
                     'addressdetails': 1
                 },
-                force_english=True
+                force_english=True,
+                blocking=False
             )
 
             if not search_results:
@@ -214,50 +437,85 @@ class AddressService:
 
             # Process results directly from search response
             results = []
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            fallback_coords: List[Tuple[int, float, float]] = []
+            pending_postcodes: List[Tuple[int, float, float]] = []
+            skipped_postcodes = 0
+            skipped_fallbacks = 0
+            # Rows at or past this position are never displayed, so they get no reverse lookups
+            fill_limit = api_config.POSTCODE_FILL_LIMIT
+            results_cap = api_config.MAX_SEARCH_RESULTS
+            make_result = functools.partial(
+                LocationData,
+                original_query=query,
+                status="OK",
+                timestamp=timestamp
+            )
 
             for item in search_results:
                 lat = item.get('lat')
                 lng = item.get('lon')
                 address = item.get('display_name')
-                zip_code = item.get('address', {}).get('postcode', '')
+                addr = item.get('address', _EMPTY)
+                zip_code = addr.get('postcode', '')
+
+                if not (lat and lng):
+                    continue
+                # Parse Nominatim's string coordinates once per hit
+                lat, lng = float(lat), float(lng)
 
-                if lat and lng and address:
-                    # If no postal code from search, try reverse geocode
+                if address:
+                    # If no postal code from search, reverse geocode it after the loop
                     if not zip_code:
-                        try:
-                            reverse_data = self._fetch_from_api(
-                                api_config.OSM_REVERSE_URL,
-                                {
-                                    'lat': lat,
-                                    'lon': lng,
-                                    'format': 'json',
-                                    'addressdetails': 1
-                                },
-                                force_english=True
-                            )
-                            if reverse_data:
-                                zip_code = reverse_data.get('address', {}).get('postcode', '—')
-                        except Exception:
-                            logger.debug("Reverse geocode for postcode failed, skipping")
-                            zip_code = '—'
-                    
-                    results.append(LocationData(
-                        original_query=query,
+                        if addr and item.get('class') in _NO_POSTCODE_CLASSES:
+                            skipped_postcodes += 1
+                        elif len(results) + len(fallback_coords) >= fill_limit:
+                            skipped_postcodes += 1
+                        else:
+                            pending_postcodes.append((len(results), lat, lng))
+
+                    results.append(make_result(
                         address=address,
                         zip_code=zip_code if zip_code else '—',
-                        lat=str(lat),
-                        lng=str(lng),
-                        status="OK",
-                        timestamp=timestamp
+                        lat=lat,
+                        lng=lng
                     ))
+
+                elif len(results) + len(fallback_coords) >= fill_limit:
+                    # Without a display name the row needs a reverse lookup; not worth a token here
+                    skipped_fallbacks += 1
                     continue
 
-                if lat and lng:
-                    fallback_results = self._reverse_geocode(
-                        float(lat), float(lng), query
-                    )
-                    results.extend(fallback_results)
+                else:
+                    # Remember where the fallback belongs so ordering is preserved
+                    fallback_coords.append((len(results), lat, lng))
+
+                # Bound the work (and any reverse lookups) to the configured result count
+                if len(results) + len(fallback_coords) >= results_cap:
+                    break
+
+            if skipped_postcodes or skipped_fallbacks:
+                logger.debug(
+                    "Skipped %s postcode and %s display-name lookups",
+                    skipped_postcodes,
+                    skipped_fallbacks
+                )
+
+            # Overlap reverse round-trips; the rate limiter still paces issuance
+            if pending_postcodes:
+                postcodes = self._fan_out(
+                    lambda pending: self._postcode_for(pending[1], pending[2]),
+                    pending_postcodes
+                )
+                for (position, _, _), postcode in zip(pending_postcodes, postcodes):
+                    results[position] = replace(results[position], zip_code=postcode)
+
+            if fallback_coords:
+                fallback_results = self._fan_out(
+                    lambda coords: self._reverse_geocode(coords[1], coords[2], query, timestamp),
+                    fallback_coords
+                )
+                for (position, _, _), fallback in reversed(list(zip(fallback_coords, fallback_results))):
+                    results.insert(position, fallback)
 
             if not results:
                 raise LocationNotFoundError(query)
@@ -271,28 +529,102 @@ class AddressService:
             logger.error("Unexpected error in search: %s", type(e).__name__)
             raise APIConnectionError("Search failed") from e
 
+@st.cache_resource(show_spinner=False)
+def get_service() -> AddressService:
+    """Return the AddressService shared across reruns and sessions."""
+    return AddressService()
+
 # ─── UI Rendering Functions ──────────────────────────────────────────────────
 
+# Static markup is built once at import; reruns only fill in dynamic fields.
+_HERO_HTML = """
+    <section class="hero-shell corner-frame">
+        <div class="hero-badge">NODE_IL // ONLINE</div>
+        <h1 class="hero-title">GEOSTUDIO//IL</h1>
+    </section>
+"""
+
+_SEARCH_FORM_HEADER_HTML = (
+    '<div class="search-form-marker"></div>'
+    '<div class="terminal-label">INPUT :: ADDRESS / COORDINATES</div>'
+)
+
+_EMPTY_HTML = """
+    <section class="empty-guidance corner-frame">
+        <div class="empty-kicker">SYSTEM_IDLE</div>
+        <h2 class="empty-title">Awaiting query</h2>
+    </section>
+"""
+
+_FOOTER_HTML = """
+    <footer class="app-footer">
+        <span>GEOSTUDIO//IL</span>
+        <span class="footer-divider">::</span>
+        <span>NOMINATIM</span>
+    </footer>
+"""
+
+_RESULT_TEMPLATE = """
+    <section class="result-shell corner-frame">
+        <div class="result-badge">MATCH_LOCKED</div>
+        <div class="result-section-label">ENGLISH_MATCH</div>
+        <div class="result-address">{address}</div>
+        <div class="metrics-grid">
+            {metrics}
+        </div>
+    </section>
+    <section class="detail-strip">
+        <div class="detail-item">
+            <span class="detail-key">Source</span>
+            <span class="detail-value">OpenStreetMap Nominatim</span>
+        </div>
+        <div class="detail-item">
+            <span class="detail-key">Resolved at</span>
+            <span class="detail-value">{timestamp}</span>
+        </div>
+    </section>
+"""
+
+_STATUS_TEMPLATE = """
+    <section class="status-card corner-frame {css_class}">
+        <div class="status-meta">{badge}</div>
+        <h3 class="status-title">{title}</h3>
+        <p class="status-body">{body}</p>
+        <p class="status-hint">{hint}</p>
+    </section>
+"""
+
+
+# Same replacements as html.escape(quote=True), applied in one C-level pass
+_HTML_ESCAPE_TABLE = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    "'": '&#x27;',
+})
+
+
+@functools.lru_cache(maxsize=256)
+def _escape(text: str) -> str:
+    """HTML-escape text, memoized since results re-render unchanged on reruns."""
+    return text.translate(_HTML_ESCAPE_TABLE)
+
+
 def inject_design_system() -> None:
     """Inject CSS design system into the app."""
-    st.markdown(DESIGN_SYSTEM_CSS, unsafe_allow_html=True)
+    st.markdown(RESOURCE_HINTS_HTML + FONT_LINK_HTML + DESIGN_SYSTEM_CSS, unsafe_allow_html=True)
 
 
 def render_search_hero() -> Tuple[str, bool]:
     """Render the hero copy and search form."""
-    st.markdown("""
-        <section class="hero-shell">
-            <div class="hero-badge">NODE_IL // ONLINE</div>
-            <h1 class="hero-title">GEOSTUDIO//IL</h1>
-        </section>
-    """, unsafe_allow_html=True)
+    st.html(_HERO_HTML)
 
     with st.form("search", clear_on_submit=False):
-        st.markdown('<div class="search-form-marker"></div>', unsafe_allow_html=True)
-        st.markdown('<div class="terminal-label">INPUT :: ADDRESS / COORDINATES</div>', unsafe_allow_html=True)
+        st.markdown(_SEARCH_FORM_HEADER_HTML, unsafe_allow_html=True)
         query = st.text_input(
             "Search",
-            value=st.session_state.get("last_query", ""),
+            value=st.session_state.last_query,
             placeholder="type hebrew address or lat,lon",
             label_visibility="collapsed"
         )
@@ -301,6 +633,12 @@ def render_search_hero() -> Tuple[str, bool]:
     return query, submitted
 
 
+def _select_example(example: str) -> None:
+    """Button callback: prefill the query before the click's rerun."""
+    st.session_state.last_query = example
+    st.session_state.auto_search = True
+
+
 def render_example_chips() -> None:
     """Render example chips in a symmetric two-by-two layout."""
     st.markdown("""
@@ -309,36 +647,26 @@ def render_example_chips() -> None:
         </div>
     """, unsafe_allow_html=True)
 
-    examples = ui_config.EXAMPLE_QUERIES
-    for row_start in range(0, len(examples), 2):
-        row = st.columns(2)
-        for index, example in enumerate(examples[row_start:row_start + 2]):
-            with row[index]:
-                if st.button(example, key=f"example_{row_start + index}", use_container_width=True):
-                    st.session_state.last_query = example
-                    st.session_state.auto_search = True
-                    st.rerun()
+    # One column pair for the whole grid; buttons alternate columns to keep the 2x2 layout
+    columns = st.columns(2)
+    for index, example in enumerate(ui_config.EXAMPLE_QUERIES):
+        with columns[index % 2]:
+            st.button(
+                example,
+                key=f"example_{index}",
+                use_container_width=True,
+                on_click=_select_example,
+                args=(example,)
+            )
 
 
 def render_empty_guidance() -> None:
     """Render compact empty guidance under the hero."""
-    st.markdown("""
-        <section class="empty-guidance">
-            <div class="empty-kicker">SYSTEM_IDLE</div>
-            <h2 class="empty-title">Awaiting query</h2>
-        </section>
-    """, unsafe_allow_html=True)
+    st.html(_EMPTY_HTML)
 
 
-def build_metric_card(
-    label: str,
-    value: str,
-    *,
-    mono: bool = False,
-    highlight: bool = False,
-    query_text: bool = False
-) -> str:
-    """Build metric card markup."""
+def _build_card_template(mono: bool, highlight: bool, query_text: bool) -> str:
+    """Build the metric card format string for one flag combination."""
     value_classes = ["metric-value"]
     if mono:
         value_classes.append("metric-value--mono")
@@ -348,49 +676,68 @@ def build_metric_card(
     card_class = "metric-card metric-card--highlight" if highlight else "metric-card"
     return (
         f'<div class="{card_class}">'
-        f'<div class="metric-label">{html.escape(label)}</div>'
-        f'<div class="{" ".join(value_classes)}">{html.escape(value)}</div>'
+        '<div class="metric-label">{label}</div>'
+        f'<div class="{" ".join(value_classes)}">{{value}}</div>'
         "</div>"
     )
 
 
+# All 8 (mono, highlight, query_text) combinations, specialized once at import
+_CARD_TEMPLATES: Dict[Tuple[bool, bool, bool], str] = {
+    flags: _build_card_template(*flags)
+    for flags in itertools.product((False, True), repeat=3)
+}
+
+
+def build_metric_card(
+    label: str,
+    value: str,
+    *,
+    mono: bool = False,
+    highlight: bool = False,
+    query_text: bool = False
+) -> str:
+    """Build metric card markup."""
+    return _CARD_TEMPLATES[(mono, highlight, query_text)].format(
+        label=_escape(label),
+        value=_escape(value)
+    )
+
+
 def render_result_overview(data: LocationData) -> None:
     """Render the main result card and the symmetric metric grid."""
     postal_value = data.zip_code if data.zip_code and data.zip_code != "—" else "Not available"
-    safe_address = html.escape(data.address)
+    safe_address = _escape(data.address)
     metrics_html = "".join([
         build_metric_card("Original query", data.original_query, query_text=True),
         build_metric_card("Postal code", postal_value, mono=True, highlight=True),
-        build_metric_card("Latitude", f"{float(data.lat):.6f}", mono=True),
-        build_metric_card("Longitude", f"{float(data.lng):.6f}", mono=True),
+        build_metric_card("Latitude", f"{data.lat:.6f}", mono=True),
+        build_metric_card("Longitude", f"{data.lng:.6f}", mono=True),
     ])
 
-    st.markdown(f"""
-        <section class="result-shell">
-            <div class="result-badge">MATCH_LOCKED</div>
-            <div class="result-section-label">ENGLISH_MATCH</div>
-            <div class="result-address">{safe_address}</div>
-            <div class="metrics-grid">
-                {metrics_html}
-            </div>
-        </section>
-        <section class="detail-strip">
-            <div class="detail-item">
-                <span class="detail-key">Source</span>
-                <span class="detail-value">OpenStreetMap Nominatim</span>
-            </div>
-            <div class="detail-item">
-                <span class="detail-key">Resolved at</span>
-                <span class="detail-value">{html.escape(data.timestamp)}</span>
-            </div>
-        </section>
-    """, unsafe_allow_html=True)
+    st.markdown(_RESULT_TEMPLATE.format(
+        address=safe_address,
+        metrics=metrics_html,
+        timestamp=_escape(data.timestamp)
+    ), unsafe_allow_html=True)
+
+
+# One-row float64 frame; copies skip pandas' dtype inference
+_MAP_DF_TEMPLATE = pd.DataFrame({"lat": [0.0], "lon": [0.0]})
+
+
+@functools.lru_cache(maxsize=64)
+def _map_df(lat: float, lng: float) -> pd.DataFrame:
+    """Build the single-point map frame once per location."""
+    frame = _MAP_DF_TEMPLATE.copy()
+    frame.iat[0, 0] = lat
+    frame.iat[0, 1] = lng
+    return frame
 
 
 def render_map_panel(data: LocationData) -> None:
     """Render the map panel."""
     st.markdown("""
-        <div class="panel-marker panel-marker--map"></div>
         <div class="panel-heading">
             <div class="panel-kicker">MAP_NODE</div>
             <h3 class="panel-title">GRID</h3>
@@ -399,10 +746,7 @@ def render_map_panel(data: LocationData) -> None:
 
     try:
         st.map(
-            pd.DataFrame({
-                "lat": [float(data.lat)],
-                "lon": [float(data.lng)],
-            }),
+            _map_df(data.lat, data.lng),
             zoom=ui_config.RESULT_MAP_ZOOM
         )
     except Exception as exc:
@@ -415,42 +759,71 @@ def render_map_panel(data: LocationData) -> None:
         )
 
 
+_LOCATION_FIELDS = tuple(field.name for field in fields(LocationData))
+
+
+@functools.lru_cache(maxsize=32)
+def _export_json(data: LocationData) -> Union[str, bytes]:
+    """Serialize a result for download once, rather than on every rerun."""
+    # LocationData is flat, so a shallow field read replaces asdict's deep copy
+    payload = {name: getattr(data, name) for name in _LOCATION_FIELDS}
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    return json.dumps(payload, indent=2, ensure_ascii=False)
+
+
+@functools.lru_cache(maxsize=32)
+def _action_targets(data: LocationData) -> Tuple[str, str]:
+    """Build the Google Maps URL and export filename once per result."""
+    safe_coords = quote(f"{data.lat:.7f},{data.lng:.7f}", safe="")
+    file_stamp = data.timestamp.translate(_FILE_STAMP_TABLE)
+    return (
+        f"https://www.google.com/maps/search/?api=1&query={safe_coords}",
+        f"location_{file_stamp}.json"
+    )
+
+
+def _clear_result() -> None:
+    """Button callback: drop the current result before the click's rerun."""
+    st.session_state.last_result = None
+
+
 def render_action_panel(data: LocationData) -> None:
     """Render the right-side action panel."""
     st.markdown("""
-        <div class="panel-marker panel-marker--actions"></div>
         <div class="panel-heading">
             <div class="panel-kicker">ACTIONS</div>
             <h3 class="panel-title">EXECUTE</h3>
         </div>
     """, unsafe_allow_html=True)
 
-    safe_coords = quote(f"{data.lat},{data.lng}", safe="")
+    maps_url, file_name = _action_targets(data)
     st.link_button(
         "Open in Google Maps",
-        f"https://www.google.com/maps/search/?api=1&query={safe_coords}",
+        maps_url,
         use_container_width=True
     )
     st.download_button(
         "Export JSON",
-        data=json.dumps(asdict(data), indent=2, ensure_ascii=False),
-        file_name=f"location_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+        data=_export_json(data),
+        file_name=file_name,
         mime="application/json",
         use_container_width=True
     )
-    if st.button("New search", use_container_width=True, key="new_search"):
-        st.session_state.last_result = None
-        st.rerun()
+    st.button("New search", use_container_width=True, key="new_search", on_click=_clear_result)
 
 def render_result_panels(data: LocationData) -> None:
     """Render the symmetric lower two-panel section."""
-    left_col, right_col = st.columns(2)
+    # Keyed containers (Streamlit 1.39+) carry an st-key-* class, so the panel CSS needs no :has() scan.
+    # The frames are drawn on the stretched columns themselves so both panels share the row height.
+    with st.container(key="result-panels"):
+        left_col, right_col = st.columns(2)
 
-    with left_col:
-        render_map_panel(data)
+        with left_col, st.container(key="panel-map"):
+            render_map_panel(data)
 
-    with right_col:
-        render_action_panel(data)
+        with right_col:
+            render_action_panel(data)
 
 
 def render_status_message(title: str, body: str, hint: str, variant: str) -> None:
@@ -462,14 +835,13 @@ def render_status_message(title: str, body: str, hint: str, variant: str) -> Non
     }
     css_class, badge = variant_map.get(variant, variant_map["info"])
 
-    st.markdown(f"""
-        <section class="status-card {css_class}">
-            <div class="status-meta">{badge}</div>
-            <h3 class="status-title">{html.escape(title)}</h3>
-            <p class="status-body">{html.escape(body)}</p>
-            <p class="status-hint">{html.escape(hint)}</p>
-        </section>
-    """, unsafe_allow_html=True)
+    st.markdown(_STATUS_TEMPLATE.format(
+        css_class=css_class,
+        badge=badge,
+        title=_escape(title),
+        body=_escape(body),
+        hint=_escape(hint)
+    ), unsafe_allow_html=True)
 
 
 def render_loading_state() -> None:
@@ -484,21 +856,78 @@ def render_loading_state() -> None:
 
 def render_footer() -> None:
     """Render the application footer."""
-    st.markdown("""
-        <footer class="app-footer">
-            <span>GEOSTUDIO//IL</span>
-            <span class="footer-divider">::</span>
-            <span>NOMINATIM</span>
-        </footer>
-    """, unsafe_allow_html=True)
+    st.html(_FOOTER_HTML)
+
+
+def render_cache_stats() -> None:
+    """Render fetch cache counters in a collapsed expander for tuning."""
+    with _CACHE_STATS_LOCK:
+        stats = dict(_CACHE_STATS)
+
+    calls = stats["calls"]
+    hits = calls - stats["misses"]
+    hit_ratio = hits / calls if calls else 0.0
+    avg_ms = stats["total_ms"] / calls if calls else 0.0
+    logger.debug("Cache stats: %s calls, %s hits, %.1f ms avg", calls, hits, avg_ms)
+
+    with st.expander("Cache stats", expanded=False):
+        hit_col, calls_col, latency_col = st.columns(3)
+        hit_col.metric("Cache hit ratio", f"{hit_ratio:.0%}")
+        calls_col.metric("Fetch calls", calls)
+        latency_col.metric("Avg fetch time", f"{avg_ms:.1f} ms")
 
 
 def init_session_state() -> None:
     """Initialize Streamlit session state."""
-    if "last_result" not in st.session_state:
-        st.session_state.last_result = None
-    if "last_query" not in st.session_state:
-        st.session_state.last_query = ""
+    st.session_state.setdefault("last_result", None)
+    st.session_state.setdefault("last_query", "")
+
+
+# Log level, log label and status card per service error type
+_ERROR_ROUTES: Dict[type, Tuple[int, str, Tuple[str, str, str, str]]] = {
+    LocationNotFoundError: (logging.WARNING, "Location not found", (
+        "No matching address found",
+        "We could not find a result for that query.",
+        "Try a broader place name or remove extra detail. Results are limited to Israel.",
+        "warning",
+    )),
+    ValidationError: (logging.WARNING, "Validation error", (
+        "Check the format",
+        "Use a street, place name, or coordinates.",
+        "Example: קישון 87 תל אביב",
+        "warning",
+    )),
+    InvalidCoordinatesError: (logging.WARNING, "Invalid coordinates", (
+        "Check the format",
+        "Coordinates must use valid latitude and longitude values.",
+        "Example: 31.7683, 35.2137",
+        "warning",
+    )),
+    RateLimitExceededError: (logging.WARNING, "Rate limit exceeded", (
+        "Too many requests",
+        "The geocoding service asked us to slow down.",
+        "Wait a few seconds and try again.",
+        "warning",
+    )),
+    APIConnectionError: (logging.ERROR, "API connection error", (
+        "Location service is unavailable",
+        "We could not reach the geocoding service right now.",
+        "Please try again in a moment. The app may be waking up from sleep.",
+        "error",
+    )),
+    GeoServiceException: (logging.ERROR, "Service error", (
+        "Location service is unavailable",
+        "The lookup failed before a result could be returned.",
+        "Please try again in a moment. The app may be waking up from sleep.",
+        "error",
+    )),
+}
+
+
+def _route_service_error(exc: GeoServiceException) -> Tuple[int, str, Tuple[str, str, str, str]]:
+    """Look up the route for exc, falling back through its base classes."""
+    # GeoServiceException is always in the MRO, so a route is always found
+    return next(_ERROR_ROUTES[cls] for cls in type(exc).__mro__ if cls in _ERROR_ROUTES)
 
 
 def main() -> None:
@@ -517,7 +946,7 @@ def main() -> None:
         loading_placeholder = st.empty()
 
         try:
-            service = AddressService()
+            service = get_service()
             with loading_placeholder.container():
                 render_loading_state()
             with st.spinner("Searching OpenStreetMap..."):
@@ -533,59 +962,9 @@ def main() -> None:
                     "warning",
                 )
 
-        except LocationNotFoundError:
-            logger.warning("Location not found: %s", query_to_search)
-            status_message = (
-                "No matching address found",
-                "We could not find a result for that query.",
-                "Try a broader place name or remove extra detail. Results are limited to Israel.",
-                "warning",
-            )
-
-        except ValidationError as exc:
-            logger.warning("Validation error: %s", exc)
-            status_message = (
-                "Check the format",
-                "Use a street, place name, or coordinates.",
-                "Example: קישון 87 תל אביב",
-                "warning",
-            )
-
-        except InvalidCoordinatesError as exc:
-            logger.warning("Invalid coordinates: %s", exc)
-            status_message = (
-                "Check the format",
-                "Coordinates must use valid latitude and longitude values.",
-                "Example: 31.7683, 35.2137",
-                "warning",
-            )
-
-        except RateLimitExceededError:
-            logger.warning("Rate limit exceeded")
-            status_message = (
-                "Too many requests",
-                "The geocoding service asked us to slow down.",
-                "Wait a few seconds and try again.",
-                "warning",
-            )
-
-        except APIConnectionError as exc:
-            logger.error("API connection error: %s", exc)
-            status_message = (
-                "Location service is unavailable",
-                "We could not reach the geocoding service right now.",
-                "Please try again in a moment. The app may be waking up from sleep.",
-                "error",
-            )
-
         except GeoServiceException as exc:
-            logger.error("Service error: %s", exc)
-            status_message = (
-                "Location service is unavailable",
-                "The lookup failed before a result could be returned.",
-                "Please try again in a moment. The app may be waking up from sleep.",
-                "error",
-            )
+            level, label, status_message = _route_service_error(exc)
+            logger.log(level, "%s: %s", label, exc)
 
         except Exception as exc:
             logger.error("Unexpected error: %s", exc, exc_info=True)
@@ -610,5 +989,8 @@ def main() -> None:
 
     render_footer()
 
+    if st.query_params.get("debug") == "1":
+        render_cache_stats()
+
 if __name__ == "__main__":
     main()
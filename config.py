@@ -11,8 +11,15 @@ class APIConfig:
     OSM_REVERSE_URL: str = "https://nominatim.openstreetmap.org/reverse"
     USER_AGENT: str = "GeoStudioAI/2.0"
     TIMEOUT_SECONDS: int = 10
+    CONNECT_TIMEOUT_SECONDS: float = 3.05
+    CONNECT_RETRIES: int = 1
+    CONNECT_RETRY_BACKOFF_FACTOR: float = 0.5
     MAX_RETRIES: int = 3
     RETRY_BACKOFF_FACTOR: float = 2.0
+    POOL_CONNECTIONS: int = 4
+    POOL_MAXSIZE: int = 10
+    MAX_FALLBACK_WORKERS: int = 4
+    POSTCODE_FILL_LIMIT: int = 1
     MAX_REQUESTS_PER_SECOND: float = 1.0
     MAX_SEARCH_RESULTS: int = 3
     DEFAULT_COUNTRY_CODE: str = "il"
@@ -23,6 +30,10 @@ class CacheConfig:
     """Caching configuration."""
     TTL_SECONDS: int = 3600
     MAX_CACHE_ENTRIES: int = 1000
+    HOT_CACHE_MAX_ENTRIES: int = 256
+    QUERY_CACHE_MAX_ENTRIES: int = 256
+    REVERSE_CACHE_MAX_ENTRIES: int = 4096
+    COORD_CACHE_PRECISION: int = 5
 
 
 @dataclass(frozen=True)
@@ -16,46 +16,43 @@ class TokenBucketRateLimiter:
         self.max_rate = max_rate
         self.capacity = capacity
         self.tokens = capacity
-        self.last_update = time.time()
-        self.lock = threading.Lock()
+        self.last_update_ns = time.monotonic_ns()
+        self.cond = threading.Condition()
         logger.debug(f"RateLimiter initialized: {max_rate} req/sec")
     
-    def _add_tokens(self) -> None:
-        """Add tokens based on elapsed time."""
-        now = time.time()
-        elapsed = now - self.last_update
-        tokens_to_add = elapsed * self.max_rate
-        self.tokens = min(self.capacity, self.tokens + tokens_to_add)
-        self.last_update = now
+    def _available_tokens(self, now_ns: int) -> float:
+        """Tokens available at now_ns, computed lazily without touching the bucket."""
+        elapsed = (now_ns - self.last_update_ns) / 1e9
+        return min(self.capacity, self.tokens + elapsed * self.max_rate)
     
     def acquire(self, blocking: bool = True) -> bool:
         """Acquire a token."""
-        with self.lock:
-            self._add_tokens()
+        with self.cond:
+            now_ns = time.monotonic_ns()
+            available = self._available_tokens(now_ns)
             
-            if self.tokens >= 1:
-                self.tokens -= 1
-                logger.debug(f"Token acquired. Remaining: {self.tokens:.2f}")
-                return True
-            
-            if not blocking:
+            if available < 1 and not blocking:
                 logger.debug("Token not available")
                 return False
             
-            wait_time = (1 - self.tokens) / self.max_rate
-            logger.debug(f"Rate limit reached. Waiting {wait_time:.2f}s")
-        
-        time.sleep(wait_time)
-        
-        with self.lock:
-            self._add_tokens()
-            if self.tokens >= 1:
-                self.tokens -= 1
-                logger.debug(f"Token acquired after wait")
-                return True
+            while available < 1:
+                wait_time = (1 - available) / self.max_rate
+                logger.debug(f"Rate limit reached. Waiting {wait_time:.2f}s")
+                self.cond.wait(timeout=wait_time)
+                now_ns = time.monotonic_ns()
+                available = self._available_tokens(now_ns)
             
-            logger.warning("Token still not available after wait")
-            return False
+            # Only consuming a token writes the bucket; fractional credit carries over
+            self.tokens = available - 1
+            self.last_update_ns = now_ns
+            logger.debug(f"Token acquired. Remaining: {self.tokens:.2f}")
+            # Wake the next waiter so it re-checks against the refreshed bucket
+            self.cond.notify()
+            return True
+    
+    def try_acquire(self) -> bool:
+        """Acquire a token without waiting."""
+        return self.acquire(blocking=False)
     
     def wait(self) -> Callable:
         """Decorator to rate-limit function calls."""
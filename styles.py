@@ -1,8 +1,86 @@
 """Cyberpunk terminal theme for the Streamlit app."""
 
-DESIGN_SYSTEM_CSS = """
-<style>
-@import url('https://fonts.googleapis.com/css2?family=IBM+Plex+Mono:wght@400;500;600;700&family=Oxanium:wght@500;600;700;800&display=swap');
+import re
+from typing import Dict
+
+_CSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+_CSS_SPACE_RE = re.compile(r"\s+")
+_CSS_PUNCT_RE = re.compile(r"\s*([{};,>])\s*")
+_CSS_COLON_RE = re.compile(r":\s+")
+_CSS_IMPORTANT_RE = re.compile(r"\s+!important")
+_CSS_LEADING_ZERO_RE = re.compile(r"(?<![\w.])0\.(\d)")
+# Custom properties only; the lookbehind skips BEM modifiers like status-card--info
+_CSS_VAR_RE = re.compile(r"(?<![\w-])--[\w-]+")
+
+
+def _minify_css(css: str) -> str:
+    """Minify CSS once at import so reruns ship fewer bytes."""
+    css = _CSS_COMMENT_RE.sub("", css)
+    css = _CSS_SPACE_RE.sub(" ", css)
+    css = _CSS_PUNCT_RE.sub(r"\1", css)
+    css = _CSS_COLON_RE.sub(":", css)
+    css = _CSS_IMPORTANT_RE.sub("!important", css)
+    css = _CSS_LEADING_ZERO_RE.sub(r".\1", css)
+    return css.replace(";}", "}").strip()
+
+
+def _short_token(index: int) -> str:
+    """Spreadsheet-style name for an index: a..z, aa, ab, ..."""
+    token = ""
+    index += 1
+    while index:
+        index, rem = divmod(index - 1, 26)
+        token = chr(97 + rem) + token
+    return token
+
+
+def _alias_custom_properties(css: str) -> Dict[str, str]:
+    """Map every custom property in the sheet to a short --token."""
+    aliases = {}
+    for name in _CSS_VAR_RE.findall(css):
+        if name not in aliases:
+            aliases[name] = f"--{_short_token(len(aliases))}"
+    return aliases
+
+
+# Only the weights the theme renders: Plex Mono 400/600/700, Oxanium 600/700/800
+FONTS_CSS_URL = (
+    "https://fonts.googleapis.com/css2?family=IBM+Plex+Mono:wght@400;600;700"
+    "&family=Oxanium:wght@600;700;800&display=optional"
+)
+
+# Emitted ahead of the style block so font DNS/TLS setup overlaps page parsing
+RESOURCE_HINTS_HTML = """
+<link rel="dns-prefetch" href="https://fonts.googleapis.com">
+<link rel="dns-prefetch" href="https://fonts.gstatic.com">
+<link rel="preconnect" href="https://fonts.googleapis.com">
+<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+"""
+
+# A plain stylesheet link: st.markdown renders through React, which never runs inline
+# onload handlers or client-side <noscript> content, so a preload swap would not fire
+FONT_LINK_HTML = f"""
+<link rel="stylesheet" href="{FONTS_CSS_URL}">
+"""
+
+_RAW_CSS = """
+@font-face {
+    font-family: 'IBM Plex Mono Fallback';
+    src: local('Menlo'), local('Courier New'), local('DejaVu Sans Mono');
+    size-adjust: 100%;
+    ascent-override: 102.5%;
+    descent-override: 27.5%;
+    line-gap-override: 0%;
+}
+
+@font-face {
+    font-family: 'Oxanium Fallback';
+    src: local('Arial'), local('Liberation Sans');
+    size-adjust: 104%;
+    ascent-override: 90%;
+    descent-override: 22%;
+    line-gap-override: 0%;
+}
 
 :root {
     --bg-0: #010203;
@@ -22,8 +100,18 @@ DESIGN_SYSTEM_CSS = """
     --muted: #86a7be;
     --shadow: 0 0 0 1px rgba(0, 246, 255, 0.03), 0 22px 70px rgba(0, 0, 0, 0.78);
     --radius: 0px;
-    --mono: 'IBM Plex Mono', SFMono-Regular, Menlo, monospace;
-    --display: 'Oxanium', 'IBM Plex Mono', monospace;
+    --mono: 'IBM Plex Mono', 'IBM Plex Mono Fallback', SFMono-Regular, Menlo, monospace;
+    --display: 'Oxanium', 'Oxanium Fallback', 'IBM Plex Mono', monospace;
+    --page-pad: 44px 24px 36px;
+    --hero-pad: 22px 24px 18px;
+    --shell-pad: 22px;
+    --card-pad: 18px 20px;
+    --panel-pad: 18px;
+    --hero-title-size: clamp(2.3rem, 5vw, 4.6rem);
+    --control-height: 50px;
+    --grid-cols: repeat(2, minmax(0, 1fr));
+    --detail-dir: row;
+    --detail-align: center;
 }
 
 * {
@@ -43,19 +131,17 @@ html, body, [class*="css"] {
     background:
         radial-gradient(circle at 15% 15%, rgba(255, 43, 214, 0.05), transparent 24%),
         radial-gradient(circle at 85% 8%, rgba(0, 246, 255, 0.04), transparent 26%),
-        linear-gradient(rgba(0, 246, 255, 0.035) 1px, transparent 1px),
-        linear-gradient(90deg, rgba(0, 246, 255, 0.035) 1px, transparent 1px),
+        url("data:image/svg+xml,%3Csvg xmlns='http://www.w3.org/2000/svg' width='26' height='26'%3E%3Cpath d='M0 .5H26M.5 0V26' stroke='%2300f6ff' stroke-opacity='.035'/%3E%3C/svg%3E"),
         linear-gradient(180deg, #000000, var(--bg-0) 18%, var(--bg-1) 52%, #02040a 100%);
-    background-size: auto, auto, 26px 26px, 26px 26px, auto;
 }
 
-.block-container {
-    max-width: 1140px !important;
-    padding: 44px 24px 36px !important;
+.stApp .block-container {
+    max-width: 1140px;
+    padding: var(--page-pad);
 }
 
-.main .block-container {
-    padding-top: 28px !important;
+.stApp .main .block-container {
+    padding-top: 28px;
 }
 
 div[data-testid="stHorizontalBlock"] {
@@ -63,8 +149,7 @@ div[data-testid="stHorizontalBlock"] {
     align-items: stretch;
 }
 
-.search-form-marker,
-.panel-marker {
+.search-form-marker {
     display: none;
 }
 
@@ -82,7 +167,7 @@ div[data-testid="stHorizontalBlock"] {
 .hero-shell {
     max-width: 860px;
     margin: 0 auto 18px;
-    padding: 22px 24px 18px;
+    padding: var(--hero-pad);
     text-align: center;
     border: 1px solid var(--line);
     background:
@@ -91,22 +176,15 @@ div[data-testid="stHorizontalBlock"] {
     box-shadow: var(--shadow);
     position: relative;
     animation: boot 160ms ease-out;
+    will-change: transform, opacity;
 }
 
-.hero-shell::before,
-.hero-shell::after,
+.corner-frame::before,
+.corner-frame::after,
 div[data-testid="stForm"]::before,
 div[data-testid="stForm"]::after,
-.result-shell::before,
-.result-shell::after,
-.status-card::before,
-.status-card::after,
-.empty-guidance::before,
-.empty-guidance::after,
-div[data-testid="column"]:has(.panel-marker--map)::before,
-div[data-testid="column"]:has(.panel-marker--map)::after,
-div[data-testid="column"]:has(.panel-marker--actions)::before,
-div[data-testid="column"]:has(.panel-marker--actions)::after {
+.st-key-result-panels div[data-testid="stColumn"]::before,
+.st-key-result-panels div[data-testid="stColumn"]::after {
     content: "";
     position: absolute;
     width: 14px;
@@ -116,25 +194,17 @@ div[data-testid="column"]:has(.panel-marker--actions)::after {
     pointer-events: none;
 }
 
-.hero-shell::before,
+.corner-frame::before,
 div[data-testid="stForm"]::before,
-.result-shell::before,
-.status-card::before,
-.empty-guidance::before,
-div[data-testid="column"]:has(.panel-marker--map)::before,
-div[data-testid="column"]:has(.panel-marker--actions)::before {
+.st-key-result-panels div[data-testid="stColumn"]::before {
     top: -1px;
     left: -1px;
     border-width: 2px 0 0 2px;
 }
 
-.hero-shell::after,
+.corner-frame::after,
 div[data-testid="stForm"]::after,
-.result-shell::after,
-.status-card::after,
-.empty-guidance::after,
-div[data-testid="column"]:has(.panel-marker--map)::after,
-div[data-testid="column"]:has(.panel-marker--actions)::after {
+.st-key-result-panels div[data-testid="stColumn"]::after {
     right: -1px;
     bottom: -1px;
     border-width: 0 2px 2px 0;
@@ -168,7 +238,7 @@ div[data-testid="column"]:has(.panel-marker--actions)::after {
 .hero-title {
     margin: 12px 0 0;
     font-family: var(--display);
-    font-size: clamp(2.3rem, 5vw, 4.6rem);
+    font-size: var(--hero-title-size);
     font-weight: 800;
     line-height: 1;
     letter-spacing: 0.02em;
@@ -187,23 +257,24 @@ div[data-testid="column"]:has(.panel-marker--actions)::after {
 .panel-note,
 .empty-body,
 .result-subnote {
-    display: none !important;
+    display: none;
 }
 
 div[data-testid="stForm"] {
     max-width: 860px;
     margin: 0 auto 22px;
-    padding: 22px;
+    padding: var(--shell-pad);
     border: 1px solid var(--line);
     background:
         linear-gradient(180deg, rgba(6, 10, 18, 0.99), rgba(1, 3, 7, 0.99));
     box-shadow: var(--shadow);
     position: relative;
+    contain: layout style;
 }
 
-.stForm {
-    border: none !important;
-    background: transparent !important;
+.stApp .stForm {
+    border: none;
+    background: transparent;
 }
 
 .terminal-label {
@@ -212,54 +283,77 @@ div[data-testid="stForm"] {
     text-align: left;
 }
 
-.stTextInput > div > div > input {
-    min-height: 58px !important;
-    border-radius: var(--radius) !important;
-    border: 1px solid var(--line-strong) !important;
-    background: rgba(0, 2, 6, 0.96) !important;
-    color: var(--text) !important;
-    font-family: var(--mono) !important;
-    font-size: 1rem !important;
-    padding: 16px 18px !important;
+.stApp .stTextInput > div > div > input {
+    min-height: 58px;
+    border-radius: var(--radius);
+    border: 1px solid var(--line-strong);
+    background: rgba(0, 2, 6, 0.96);
+    color: var(--text);
+    font-family: var(--mono);
+    font-size: 1rem;
+    padding: 16px 18px;
     box-shadow:
         inset 0 0 0 1px rgba(255, 43, 214, 0.08),
-        0 0 0 1px rgba(0, 246, 255, 0.03) !important;
-    transition: border-color 120ms ease, box-shadow 120ms ease !important;
+        0 0 0 1px rgba(0, 246, 255, 0.03);
+    transition: border-color 120ms ease, box-shadow 120ms ease;
 }
 
-.stTextInput > div > div > input::placeholder {
-    color: rgba(134, 167, 190, 0.85) !important;
+.stApp .stTextInput > div > div > input::placeholder {
+    color: rgba(134, 167, 190, 0.85);
     opacity: 1;
 }
 
-.stTextInput > div > div > input:hover {
-    border-color: var(--cyan) !important;
+.stApp .stTextInput > div > div > input:hover {
+    border-color: var(--cyan);
 }
 
-.stTextInput > div > div > input:focus {
-    border-color: var(--cyan) !important;
+.stApp .stTextInput > div > div > input:focus {
+    border-color: var(--cyan);
     box-shadow:
         inset 0 0 0 1px rgba(255, 43, 214, 0.15),
         0 0 0 1px rgba(0, 246, 255, 0.08),
-        0 0 18px rgba(0, 246, 255, 0.14) !important;
+        0 0 18px rgba(0, 246, 255, 0.14);
 }
 
 .stFormSubmitButton > button,
 .stButton > button,
 .stDownloadButton > button,
 .stLinkButton > a {
-    min-height: 50px !important;
+    min-height: var(--control-height) !important;
     border-radius: var(--radius) !important;
     font-family: var(--mono) !important;
     font-weight: 700 !important;
     font-size: 0.9rem !important;
     letter-spacing: 0.08em !important;
     text-transform: uppercase !important;
-    transition:
-        border-color 120ms ease,
-        box-shadow 120ms ease,
-        transform 120ms ease,
-        background-color 120ms ease !important;
+    position: relative;
+    transition: transform 120ms ease !important;
+}
+
+.stFormSubmitButton > button::after,
+.stButton > button::after,
+.stDownloadButton > button::after,
+.stLinkButton > a::after {
+    content: "";
+    position: absolute;
+    inset: -1px;
+    box-shadow: 0 0 16px rgba(255, 43, 214, 0.08);
+    opacity: 0;
+    pointer-events: none;
+    transition: opacity 120ms ease;
+}
+
+.stFormSubmitButton > button::after {
+    box-shadow:
+        inset 0 0 0 1px rgba(255, 43, 214, 0.08),
+        0 0 20px rgba(255, 43, 214, 0.12);
+}
+
+.stFormSubmitButton > button:hover::after,
+.stButton > button:hover::after,
+.stDownloadButton > button:hover::after,
+.stLinkButton > a:hover::after {
+    opacity: 1;
 }
 
 .stFormSubmitButton > button {
@@ -275,9 +369,6 @@ div[data-testid="stForm"] {
 .stFormSubmitButton > button:hover {
     transform: translateY(-1px) !important;
     border-color: var(--hot) !important;
-    box-shadow:
-        inset 0 0 0 1px rgba(255, 43, 214, 0.08),
-        0 0 20px rgba(255, 43, 214, 0.12) !important;
 }
 
 .stButton > button,
@@ -300,7 +391,6 @@ div[data-testid="stForm"] {
 .stLinkButton > a:hover {
     transform: translateY(-1px) !important;
     border-color: var(--hot) !important;
-    box-shadow: 0 0 16px rgba(255, 43, 214, 0.08) !important;
 }
 
 .stTextInput > div > div > input:focus-visible,
@@ -312,22 +402,113 @@ div[data-testid="stForm"] {
     outline-offset: 2px !important;
 }
 
-.status-card,
-.empty-guidance,
-.result-shell,
-div[data-testid="column"]:has(.panel-marker--map),
-div[data-testid="column"]:has(.panel-marker--actions) {
+.corner-frame {
+    position: relative;
+    contain: layout style;
+}
+
+.empty-guidance {
+    max-width: 860px;
+    margin: 12px auto 0;
+    padding: var(--card-pad);
+    border: 1px solid var(--line);
+    background: var(--panel);
+    box-shadow: var(--shadow);
+    text-align: center;
+}
+
+.empty-kicker {
+    color: var(--hot);
+}
+
+.empty-title {
+    margin: 10px 0 0;
+    font-family: var(--display);
+    font-size: 1.15rem;
+    font-weight: 700;
+    letter-spacing: 0.08em;
+    text-transform: uppercase;
+    color: var(--text);
+}
+
+.app-footer {
+    max-width: 980px;
+    margin: 26px auto 0;
+    padding-top: 14px;
+    border-top: 1px solid rgba(0, 246, 255, 0.14);
+    display: flex;
+    justify-content: center;
+    align-items: center;
+    gap: 10px;
+    flex-wrap: wrap;
+    font-family: var(--mono);
+    font-size: 0.72rem;
+    font-weight: 600;
+    letter-spacing: 0.08em;
+    color: var(--muted);
+    text-transform: uppercase;
+}
+
+.footer-divider {
+    color: var(--hot);
+}
+
+@supports (content-visibility: auto) {
+    .detail-strip {
+        content-visibility: auto;
+        contain-intrinsic-size: auto 64px;
+    }
+
+    .app-footer {
+        content-visibility: auto;
+        contain-intrinsic-size: auto 40px;
+    }
+}
+
+@media (max-width: 768px) {
+    :root {
+        --page-pad: 24px 14px 30px;
+        --hero-pad: 16px;
+        --shell-pad: 16px;
+        --card-pad: 16px;
+        --panel-pad: 16px;
+        --hero-title-size: 2rem;
+        --control-height: 48px;
+        --grid-cols: 1fr;
+        --detail-dir: column;
+        --detail-align: flex-start;
+    }
+
+    div[data-testid="stColumn"] {
+        width: 100% !important;
+        flex: 1 1 100% !important;
+    }
+}
+
+@media (prefers-reduced-motion: reduce) {
+    *,
+    *::before,
+    *::after {
+        animation: none !important;
+        transition: none !important;
+        scroll-behavior: auto !important;
+    }
+}
+
+.st-key-result-panels div[data-testid="stColumn"] {
     position: relative;
+    contain: layout style;
 }
 
 .status-card {
     max-width: 860px;
     margin: 0 auto 18px;
-    padding: 18px 20px;
+    padding: var(--card-pad);
     border: 1px solid var(--line);
     background: var(--panel-strong);
     box-shadow: var(--shadow);
     animation: boot 140ms ease-out;
+    will-change: transform, opacity;
 }
 
 .status-card--info {
@@ -351,6 +532,7 @@ div[data-testid="column"]:has(.panel-marker--actions) {
     margin: 10px 0 6px;
     font-family: var(--display);
     font-size: 1.15rem;
+    font-weight: 600;
     color: var(--text);
     letter-spacing: 0.04em;
 }
@@ -367,39 +549,16 @@ div[data-testid="column"]:has(.panel-marker--actions) {
     margin-top: 4px;
 }
 
-.empty-guidance {
-    max-width: 860px;
-    margin: 12px auto 0;
-    padding: 18px 20px;
-    border: 1px solid var(--line);
-    background: var(--panel);
-    box-shadow: var(--shadow);
-    text-align: center;
-}
-
-.empty-kicker {
-    color: var(--hot);
-}
-
-.empty-title {
-    margin: 10px 0 0;
-    font-family: var(--display);
-    font-size: 1.15rem;
-    font-weight: 700;
-    letter-spacing: 0.08em;
-    text-transform: uppercase;
-    color: var(--text);
-}
-
 .result-shell {
     max-width: 980px;
     margin: 24px auto 16px;
-    padding: 22px;
+    padding: var(--shell-pad);
     border: 1px solid var(--line);
     background:
         linear-gradient(180deg, rgba(5, 8, 15, 0.99), rgba(1, 2, 6, 0.99));
     box-shadow: var(--shadow);
     animation: boot 160ms ease-out;
+    will-change: transform, opacity;
 }
 
 .result-badge {
@@ -430,7 +589,7 @@ div[data-testid="column"]:has(.panel-marker--actions) {
 
 .metrics-grid {
     display: grid;
-    grid-template-columns: repeat(2, minmax(0, 1fr));
+    grid-template-columns: var(--grid-cols);
     gap: 16px;
     margin-top: 22px;
 }
@@ -476,7 +635,7 @@ div[data-testid="column"]:has(.panel-marker--actions) {
     max-width: 980px;
     margin: 0 auto 16px;
     display: grid;
-    grid-template-columns: repeat(2, minmax(0, 1fr));
+    grid-template-columns: var(--grid-cols);
     gap: 16px;
 }
 
@@ -485,8 +644,9 @@ div[data-testid="column"]:has(.panel-marker--actions) {
     border: 1px solid rgba(0, 246, 255, 0.12);
     background: rgba(2, 5, 10, 0.94);
     display: flex;
+    flex-direction: var(--detail-dir);
     justify-content: space-between;
-    align-items: center;
+    align-items: var(--detail-align);
     gap: 12px;
 }
 
@@ -497,9 +657,8 @@ div[data-testid="column"]:has(.panel-marker--actions) {
     text-align: right;
 }
 
-div[data-testid="column"]:has(.panel-marker--map),
-div[data-testid="column"]:has(.panel-marker--actions) {
-    padding: 18px;
+.st-key-result-panels div[data-testid="stColumn"] {
+    padding: var(--panel-pad);
     border: 1px solid var(--line);
     background: var(--panel-strong);
     box-shadow: var(--shadow);
@@ -513,96 +672,36 @@ div[data-testid="column"]:has(.panel-marker--actions) {
     margin: 10px 0 16px;
     font-family: var(--display);
     font-size: 1.12rem;
+    font-weight: 600;
     letter-spacing: 0.08em;
     text-transform: uppercase;
     color: var(--text);
 }
 
-div[data-testid="column"]:has(.panel-marker--map) div[data-testid="stDeckGlJsonChart"] {
+.st-key-panel-map div[data-testid="stDeckGlJsonChart"] {
     border: 1px solid rgba(0, 246, 255, 0.18);
     overflow: hidden;
 }
 
-.stSpinner > div {
-    border-color: var(--cyan) !important;
-}
-
-.app-footer {
-    max-width: 980px;
-    margin: 26px auto 0;
-    padding-top: 14px;
-    border-top: 1px solid rgba(0, 246, 255, 0.14);
-    display: flex;
-    justify-content: center;
-    align-items: center;
-    gap: 10px;
-    flex-wrap: wrap;
-    font-family: var(--mono);
-    font-size: 0.72rem;
-    font-weight: 600;
-    letter-spacing: 0.08em;
-    color: var(--muted);
-    text-transform: uppercase;
-}
-
-.footer-divider {
-    color: var(--hot);
+.stApp .stSpinner > div {
+    border-color: var(--cyan);
 }
 
-@media (max-width: 768px) {
-    .block-container {
-        padding: 24px 14px 30px !important;
-    }
-
+@media (prefers-reduced-motion: reduce) {
     .hero-shell,
-    div[data-testid="stForm"],
     .status-card,
-    .empty-guidance {
-        max-width: 100%;
-        padding: 16px;
-    }
-
-    .hero-title {
-        font-size: 2rem;
+    .result-shell {
+        will-change: auto;
     }
+}
+"""
 
-    .result-shell,
-    div[data-testid="column"]:has(.panel-marker--map),
-    div[data-testid="column"]:has(.panel-marker--actions) {
-        padding: 16px;
-    }
+_CSS_ALIASES = _alias_custom_properties(_RAW_CSS)
 
-    .metrics-grid,
-    .detail-strip {
-        grid-template-columns: 1fr;
-    }
 
-    .detail-item {
-        align-items: flex-start;
-        flex-direction: column;
-    }
+def _build_css(raw_css: str) -> str:
+    """Minify a sheet and swap its custom properties for their short aliases."""
+    return _CSS_VAR_RE.sub(lambda match: _CSS_ALIASES[match.group()], _minify_css(raw_css))
 
-    div[data-testid="column"] {
-        width: 100% !important;
-        flex: 1 1 100% !important;
-    }
-
-    .stFormSubmitButton > button,
-    .stButton > button,
-    .stDownloadButton > button,
-    .stLinkButton > a {
-        min-height: 48px !important;
-    }
-}
 
-@media (prefers-reduced-motion: reduce) {
-    *,
-    *::before,
-    *::after {
-        animation: none !important;
-        transition: none !important;
-        scroll-behavior: auto !important;
-    }
-}
-</style>
-"""
+DESIGN_SYSTEM_CSS = f"<style>{_build_css(_RAW_CSS)}</style>"
@@ -1,6 +1,9 @@
 """Input Validation Module."""
 
+import logging
+import math
 import re
+import string
 from typing import Tuple, Optional
 
 from config import validation_config
@@ -8,111 +11,169 @@ from exceptions import ValidationError, InvalidCoordinatesError
 from logger import logger
 
 
+# Characters outside this set are replaced with spaces during sanitization
+_SANITIZE_RE = re.compile(r'[^\w\s\u0590-\u05FF\d"\'.,()+-]')
+# ASCII subset of the allowed set; \w also admits "_"
+_ASCII_ALLOWED = frozenset(string.ascii_letters + string.digits + string.whitespace + '_"\'.,()+-')
+
+# Bound once; the config is frozen, so the per-call attribute lookups buy nothing
+_MIN_LAT = validation_config.MIN_LATITUDE
+_MAX_LAT = validation_config.MAX_LATITUDE
+_MIN_LNG = validation_config.MIN_LONGITUDE
+_MAX_LNG = validation_config.MAX_LONGITUDE
+_LAT_RANGE_MSG = f"Latitude must be between {_MIN_LAT} and {_MAX_LAT}"
+_LNG_RANGE_MSG = f"Longitude must be between {_MIN_LNG} and {_MAX_LNG}"
+
+# Both coordinate forms start with a digit, a sign or a "lat" label; digits are
+# tested with str.isdigit() since \d (and float()) also accept non-ASCII digits
+_COORD_LEAD_CHARS = frozenset("+-lL")
+
+# Strict pair ("31.7683, 35.2137" or "31 35") or labeled pair
+# ("lat: 31.7683, lon: 35.2137") in one anchored scan
+_COORD_RE = re.compile(
+    r"^\s*(?:"
+    r"(?P<lat1>[-+]?\d{1,3}(?:\.\d+)?)\s*[,\s]\s*(?P<lng1>[-+]?\d{1,3}(?:\.\d+)?)"
+    r"|lat(?:itude)?\s*[:=]\s*(?P<lat2>[-+]?\d{1,3}(?:\.\d+)?)\s*[,\s]+"
+    r"(?:lon|lng|longitude)\s*[:=]\s*(?P<lng2>[-+]?\d{1,3}(?:\.\d+)?)"
+    r")\s*$",
+    re.IGNORECASE
+)
+
+
+def _sanitize_text(text: str) -> str:
+    """Replace disallowed characters and collapse whitespace."""
+    # Clean ASCII input (most addresses and all coordinates) cannot change under the regex
+    if not (text.isascii() and _ASCII_ALLOWED.issuperset(text)):
+        text = _SANITIZE_RE.sub(' ', text)
+    return ' '.join(text.split())
+
+
+def _query_error(query: str) -> Optional[str]:
+    """Return why a stripped query is rejected, or None if it is acceptable."""
+    if len(query) < validation_config.MIN_QUERY_LENGTH:
+        return f"Query too short (min {validation_config.MIN_QUERY_LENGTH} characters)"
+    if len(query) > validation_config.MAX_QUERY_LENGTH:
+        return f"Query too long (max {validation_config.MAX_QUERY_LENGTH} characters)"
+    return None
+
+
+def _coordinate_error(lat: float, lng: float) -> Optional[str]:
+    """Return why a coordinate pair is rejected, or None if it is in range."""
+    if not (math.isfinite(lat) and math.isfinite(lng)):
+        return "Coordinates must be finite numbers"
+    if lat < _MIN_LAT or lat > _MAX_LAT:
+        return _LAT_RANGE_MSG
+    if lng < _MIN_LNG or lng > _MAX_LNG:
+        return _LNG_RANGE_MSG
+    return None
+
+
+def validate_query(query: str) -> str:
+    """Validate query."""
+    if not query:
+        raise ValidationError("Query cannot be empty", field="query")
+
+    query = query.strip()
+
+    error = _query_error(query)
+    if error is not None:
+        raise ValidationError(error, field="query")
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Query validated: %s...", query[:50])
+    return query
+
+
+def sanitize_query(query: str) -> str:
+    """Sanitize query."""
+    sanitized = _sanitize_text(query)
+
+    if sanitized != query:
+        logger.debug("Query sanitized")
+
+    return sanitized
+
+
+def validate_and_sanitize_query(query: str) -> str:
+    """Validate and sanitize query in a single call."""
+    if not query:
+        raise ValidationError("Query cannot be empty", field="query")
+
+    stripped = query.strip()
+
+    error = _query_error(stripped)
+    if error is not None:
+        raise ValidationError(error, field="query")
+
+    return _sanitize_text(stripped)
+
+
+def validate_coords(lat: float, lng: float) -> Tuple[float, float]:
+    """Validate coordinates."""
+    try:
+        lat_float = float(lat)
+        lng_float = float(lng)
+    except (ValueError, TypeError) as e:
+        logger.warning("Invalid coordinate format: lat=%s, lng=%s", lat, lng)
+        raise InvalidCoordinatesError(message=f"Coordinates must be numbers: {e}")
+
+    error = _coordinate_error(lat_float, lng_float)
+    if error is not None:
+        logger.warning("Coordinates rejected: %s, %s", lat_float, lng_float)
+        raise InvalidCoordinatesError(lat=lat_float, lng=lng_float, message=error)
+
+    logger.debug("Coordinates validated: %.6f, %.6f", lat_float, lng_float)
+    return lat_float, lng_float
+
+
+def parse_coords(query: str, strict: bool = False) -> Optional[Tuple[float, float]]:
+    """Extract coordinates from query.
+
+    Args:
+        query: Raw user query
+        strict: When True, raise InvalidCoordinatesError if query format
+            looks like coordinates but values are out of range/invalid.
+    """
+    normalized_query = query.strip()
+    if not normalized_query:
+        return None
+    lead = normalized_query[0]
+    if not (lead.isdigit() or lead in _COORD_LEAD_CHARS):
+        # Place names fail here, before any regex runs
+        return None
+
+    match = _COORD_RE.match(normalized_query)
+    if not match:
+        return None
+
+    # The groups are signed \d decimals, Unicode digits included; float() parses all of them
+    lat = float(match.group('lat1') or match.group('lat2'))
+    lng = float(match.group('lng1') or match.group('lng2'))
+
+    error = _coordinate_error(lat, lng)
+    if error is not None:
+        logger.debug("Query looks like coordinates but values are invalid")
+        if strict:
+            raise InvalidCoordinatesError(lat=lat, lng=lng, message=error)
+        return None
+
+    logger.info("Extracted coordinates: %s, %s", lat, lng)
+    return lat, lng
+
+
 class QueryValidator:
     """Validates search queries."""
-    
-    @staticmethod
-    def validate(query: str) -> str:
-        """Validate query."""
-        if not query:
-            raise ValidationError("Query cannot be empty", field="query")
-        
-        query = query.strip()
-        
-        if len(query) < validation_config.MIN_QUERY_LENGTH:
-            raise ValidationError(
-                f"Query too short (min {validation_config.MIN_QUERY_LENGTH} characters)",
-                field="query"
-            )
-        
-        if len(query) > validation_config.MAX_QUERY_LENGTH:
-            raise ValidationError(
-                f"Query too long (max {validation_config.MAX_QUERY_LENGTH} characters)",
-                field="query"
-            )
-        
-        logger.debug(f"Query validated: {query[:50]}...")
-        return query
-    
-    @staticmethod
-    def sanitize(query: str) -> str:
-        """Sanitize query."""
-        sanitized = re.sub(r'[^\w\s\u0590-\u05FF\d"\'.,()+-]', ' ', query)
-        sanitized = ' '.join(sanitized.split())
-        
-        if sanitized != query:
-            logger.debug(f"Query sanitized")
-        
-        return sanitized
+
+    validate = staticmethod(validate_query)
+    sanitize = staticmethod(sanitize_query)
+    validate_and_sanitize = staticmethod(validate_and_sanitize_query)
 
 
 class CoordinateValidator:
     """Validates GPS coordinates."""
-    
-    @staticmethod
-    def validate(lat: float, lng: float) -> Tuple[float, float]:
-        """Validate coordinates."""
-        try:
-            lat_float = float(lat)
-            lng_float = float(lng)
-        except (ValueError, TypeError) as e:
-            logger.warning(f"Invalid coordinate format: lat={lat}, lng={lng}")
-            raise InvalidCoordinatesError(message=f"Coordinates must be numbers: {e}")
-        
-        if not (validation_config.MIN_LATITUDE <= lat_float <= validation_config.MAX_LATITUDE):
-            logger.warning(f"Latitude out of range: {lat_float}")
-            raise InvalidCoordinatesError(
-                lat=lat_float,
-                lng=lng_float,
-                message=f"Latitude must be between {validation_config.MIN_LATITUDE} and {validation_config.MAX_LATITUDE}"
-            )
-        
-        if not (validation_config.MIN_LONGITUDE <= lng_float <= validation_config.MAX_LONGITUDE):
-            logger.warning(f"Longitude out of range: {lng_float}")
-            raise InvalidCoordinatesError(
-                lat=lat_float,
-                lng=lng_float,
-                message=f"Longitude must be between {validation_config.MIN_LONGITUDE} and {validation_config.MAX_LONGITUDE}"
-            )
-        
-        logger.debug(f"Coordinates validated: {lat_float:.6f}, {lng_float:.6f}")
-        return lat_float, lng_float
-    
-    @staticmethod
-    def parse_from_query(query: str, strict: bool = False) -> Optional[Tuple[float, float]]:
-        """Extract coordinates from query.
-
-        Args:
-            query: Raw user query
-            strict: When True, raise InvalidCoordinatesError if query format
-                looks like coordinates but values are out of range/invalid.
-        """
-        normalized_query = query.strip()
-
-        patterns = [
-            # Strict coordinate pair: "31.7683, 35.2137" or "31 35"
-            r"^\s*([-+]?\d{1,3}(?:\.\d+)?)\s*[,\s]\s*([-+]?\d{1,3}(?:\.\d+)?)\s*$",
-            # Labeled coordinate pair: "lat: 31.7683, lon: 35.2137"
-            r"^\s*lat(?:itude)?\s*[:=]\s*([-+]?\d{1,3}(?:\.\d+)?)\s*[,\s]+"
-            r"(?:lon|lng|longitude)\s*[:=]\s*([-+]?\d{1,3}(?:\.\d+)?)\s*$",
-        ]
-
-        for pattern in patterns:
-            match = re.match(pattern, normalized_query, re.IGNORECASE)
-            if not match:
-                continue
-
-            try:
-                lat, lng = CoordinateValidator.validate(match.group(1), match.group(2))
-                logger.info(f"Extracted coordinates: {lat}, {lng}")
-                return lat, lng
-            except InvalidCoordinatesError:
-                logger.debug("Query looks like coordinates but values are invalid")
-                if strict:
-                    raise
-                return None
 
-        return None
+    validate = staticmethod(validate_coords)
+    parse_from_query = staticmethod(parse_coords)
 
 
 class ResponseValidator:
@@ -121,15 +182,17 @@ class ResponseValidator:
     @staticmethod
     def validate_osm_search_response(data: list) -> list:
         """Validate search response."""
-        if not isinstance(data, list):
+        # Decoded JSON arrays are always exact lists, so skip isinstance's subclass walk
+        if type(data) is not list:
             raise ValidationError("Expected list response from API")
-        logger.debug(f"Search response validated: {len(data)} results")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Search response validated: %d results", len(data))
         return data
     
     @staticmethod
     def validate_osm_reverse_response(data: dict) -> dict:
         """Validate reverse geocoding response."""
-        if not isinstance(data, dict):
+        if type(data) is not dict:
             raise ValidationError("Expected dict response from reverse API")
         
         if 'display_name' not in data: